@@ -8,17 +8,174 @@ Classes:
 
 from __future__ import annotations
 
+import functools
+import math
 import random
-import time
+from collections import deque
 from dataclasses import dataclass
+from itertools import compress
+from typing import Callable
 
 from terminaltexteffects import Color, Coord, EffectCharacter, Gradient, easing
+from terminaltexteffects.engine.animation import Scene
 from terminaltexteffects.engine.base_config import BaseConfig
 from terminaltexteffects.engine.base_effect import BaseEffect, BaseEffectIterator
 from terminaltexteffects.utils import argutils
 from terminaltexteffects.utils.argutils import ArgSpec, ParserSpec
 from terminaltexteffects.utils.graphics import ColorPair
 
+# Tree and text colors, created once rather than per character
+_GOLD_COLOR = Color("ffd700")  # Bright gold
+_DULL_GOLD_COLOR = Color("6b6b5a")  # Dull gray-gold
+_TRUNK_COLOR = Color("8b4513")  # Brown
+_DULL_BAUBLE_COLOR = Color("4a4a4a")  # Dull gray
+_TREE_COLOR = Color("228b22")  # Green
+_ORNAMENT_COLORS = (
+    Color("ff0000"),  # Red
+    Color("ff69b4"),  # Pink
+    _GOLD_COLOR,  # Gold
+    Color("00ffff"),  # Cyan
+    Color("ff00ff"),  # Magenta
+    Color("ff8c00"),  # Dark orange
+)
+
+# Ornament symbols that get bright colors
+_ORNAMENT_SYMBOLS = frozenset("*@&%Oo+")
+
+# Christmas tree ASCII art
+_TREE_LINES = (
+    "                        ,",
+    "                      _/^\\_",
+    "                     <     >",
+    "                      /.-.\\         ",
+    "                      `/&\\`                   ",
+    "                     ,@.*;@,",
+    "                    /_o.I %_\\     ",
+    "                   (`'--:o(_@;",
+    "                  /`;--.,__ `')              ",
+    "                 ;@`o % O,*`'`&\\ ",
+    "                (`'--)_@ ;o %'()\\       ",
+    "                /`;--._`''--._O'@;",
+    "               /&*,()~o`;-.,_ `\"\"\")",
+    "               /`,@ ;+& () o*`;-';\\",
+    "              (`\"\"--.,_0 +% @' &()\\",
+    "              /-.,_    ``''--....-'`)",
+    "              /@%;o`:;'--,.__   __.\'\\",
+    "             ;*,&(); @ % &^;~`\"`o;@();          ",
+    "             /(); o^~; & ().o@*&`;&%O\\",
+    "             `\"=\"==\"\"==,,,.,=\"==\"===\"`",
+    "          __.----.---''#####---...___...-----._",
+    "        '`            `\"\"\"\"\"`",
+)
+
+# Tree cell categories - decide the dull (building) and bright (complete) colors
+_STAR, _TRUNK, _BAUBLE, _BRANCH = range(4)
+_TREE_CATEGORY_COLORS: dict[int, tuple[Color, Color | None]] = {
+    _STAR: (_DULL_GOLD_COLOR, _GOLD_COLOR),
+    _TRUNK: (_TRUNK_COLOR, _TRUNK_COLOR),  # Same when lit
+    _BAUBLE: (_DULL_BAUBLE_COLOR, None),  # Lit with a random ornament color
+    _BRANCH: (_TREE_COLOR, _TREE_COLOR),  # Same when lit
+}
+
+
+@functools.lru_cache(maxsize=32)
+def _fg_pair(color: Color) -> ColorPair:
+    """Get a shared foreground-only ColorPair for a color.
+
+    Args:
+        color (Color): The foreground color.
+
+    Returns:
+        ColorPair: The color pair, reused for every call with an equal color.
+
+    """
+    return ColorPair(fg=color)
+
+
+def _new_solid_scene(character: EffectCharacter, symbol: str, color: Color) -> Scene:
+    """Create a single-frame scene showing a symbol in one foreground color.
+
+    Args:
+        character (EffectCharacter): The character the scene belongs to.
+        symbol (str): The symbol to show.
+        color (Color): The foreground color.
+
+    Returns:
+        Scene: The new scene.
+
+    """
+    scene = character.animation.new_scene()
+    scene.add_frame(symbol, 1, colors=_fg_pair(color))
+    return scene
+
+
+def _classify_tree_cells(
+    tree_lines: tuple[str, ...],
+) -> tuple[tuple[str, ...], tuple[int, ...], tuple[int, ...], tuple[int, ...]]:
+    """Flatten the tree art into parallel per-cell sequences, skipping spaces.
+
+    Args:
+        tree_lines (tuple[str, ...]): The tree art, top line first.
+
+    Returns:
+        tuple[tuple[str, ...], tuple[int, ...], tuple[int, ...], tuple[int, ...]]: The symbol, row offset from
+            the bottom line, column offset, and category of every non-space cell.
+
+    """
+    tree_height = len(tree_lines)
+    symbols: list[str] = []
+    row_offsets: list[int] = []
+    col_offsets: list[int] = []
+    categories: list[int] = []
+    for line_index, line in enumerate(tree_lines):
+        for col_offset, char in enumerate(line):
+            if char == " ":
+                continue
+            if line_index < 4:  # Include one more line for the star
+                category = _STAR
+            elif line_index >= tree_height - 2 or char == "#":
+                category = _TRUNK
+            elif char in _ORNAMENT_SYMBOLS:
+                category = _BAUBLE
+            else:
+                category = _BRANCH
+            symbols.append(char)
+            # Trunk (last line) at bottom, star (first line) higher up
+            row_offsets.append(tree_height - 1 - line_index)
+            col_offsets.append(col_offset)
+            categories.append(category)
+    return tuple(symbols), tuple(row_offsets), tuple(col_offsets), tuple(categories)
+
+
+_TREE_SYMBOLS, _TREE_ROW_OFFSETS, _TREE_COL_OFFSETS, _TREE_CATEGORIES = _classify_tree_cells(_TREE_LINES)
+_TREE_WIDTH = max(len(line) for line in _TREE_LINES)
+
+# Background snow reuses a pool of pre-generated sway trajectories
+_SWAY_AMOUNTS = (1, 2, 3)
+_SWAY_TEMPLATE_COUNT = 64
+# Random draws for background snow spawns are made in batches of this size (a full run spawns ~75 flakes)
+_SPAWN_DRAW_BATCH = 64
+
+
+def _interior_mask(occupancy: list[int]) -> list[int]:
+    """Compute the interior cells of a padded per-row occupancy bitmask.
+
+    A cell is interior when all 4 neighbors (up, down, left, right) are occupied, whether or not the
+    cell itself is. Whole rows are shifted and AND-ed together so every cell in a row is tested at once.
+
+    Args:
+        occupancy (list[int]): Occupied cells as one bitmask per row, with an empty row/column of padding.
+
+    Returns:
+        list[int]: Interior cells as one bitmask per row, in the same layout as `occupancy`.
+
+    """
+    interior = [0] * len(occupancy)
+    for row in range(1, len(occupancy) - 1):
+        cells = occupancy[row]
+        interior[row] = occupancy[row - 1] & occupancy[row + 1] & (cells << 1) & (cells >> 1)
+    return interior
+
 
 def get_effect_resources() -> tuple[str, type[BaseEffect], type[BaseConfig]]:
     """Get the command, effect class, and configuration class for the effect.
@@ -128,19 +285,47 @@ class ChristmasIterator(BaseEffectIterator[ChristmasConfig]):
 
         """
         super().__init__(effect)
-        self.pending_chars: list[EffectCharacter] = []
+        # Canvas bounds are fixed for the life of the effect
+        canvas = self.terminal.canvas
+        self._left, self._right, self._top, self._bottom = canvas.left, canvas.right, canvas.top, canvas.bottom
+        self._width = self._right - self._left + 1
+        self.pending_chars: deque[EffectCharacter] = deque()
         self.background_snow: list[EffectCharacter] = []
-        self.bottom_pile_height: dict[int, int] = {}
+        # Snow pile height per canvas column, indexed by column - canvas.left
+        self.bottom_pile_height: bytearray = bytearray(self._width)
+        # Interior cell bitmask per row, padded by one cell - built on first use by is_outline_character
+        self._interior: list[int] | None = None
+        self._interior_origin: Coord = Coord(0, 0)
         self.text_spawn_delay: int = 0
         self.background_spawn_delay: int = 0
         self.text_complete: bool = False
         self.fadeout_counter: int = 0
         self.spawn_stopped: bool = False
-        self.lights_to_activate: list = []  # Queue of (char, scene) to light up
+        self.lights_to_activate: deque = deque()  # Queue of (char, scene) to light up
         self.light_delay: int = 0
         self.input_chars: list = []  # Store input text characters
         self.input_chars_revealed: bool = False
         self.snow_accelerated: bool = False
+        self.moving_tree_count: int = 0  # Tree characters still sliding into place
+        self.moving_input_count: int = 0  # Input characters still sliding into place
+        # Per-iterator random source with its per-frame methods bound up front
+        # Seeded from the module generator so random.seed() still reproduces the effect
+        self._rng: random.Random = random.Random(random.getrandbits(64))
+        self._random = self._rng.random
+        self._randint = self._rng.randint
+        # Current step of the tree and text sequence, replaced as each one completes
+        self._phase: Callable[[], None] = self._build_tree
+        # Current background snow spawning behavior, replaced as the tree completes and snow stops
+        self._snowfall: Callable[[], None] = self._snow_while_building
+        # Produces each frame; switches to draining the remaining snow once spawning stops
+        self._next_frame: Callable[[], str] = self._snowing_frame
+        self.background_spawn_delay = 4 * self._failed_spawn_checks(0.25)
+        # (column offset, row) waypoints for background snow, translated to each flake's column
+        self._sway_templates: list[tuple[tuple[int, int], ...]] = [
+            self._new_sway_template() for _ in range(_SWAY_TEMPLATE_COUNT)
+        ]
+        # Pre-drawn (column, symbol, color, speed factor, sway template) for upcoming background snow
+        self._spawn_draws: list[tuple[int, str, Color, float, tuple[tuple[int, int], ...]]] = []
         self.build()
 
     def is_outline_character(self, character: EffectCharacter) -> bool:
@@ -152,27 +337,41 @@ class ChristmasIterator(BaseEffectIterator[ChristmasConfig]):
         Returns:
             bool: True if character is on the outline, False if interior.
         """
-        coord = character.input_coord
-        # Check all 4 neighbors (up, down, left, right)
-        neighbors = [
-            Coord(coord.column, coord.row - 1),  # up
-            Coord(coord.column, coord.row + 1),  # down
-            Coord(coord.column - 1, coord.row),  # left
-            Coord(coord.column + 1, coord.row),  # right
-        ]
+        if self._interior is None:
+            self._interior = self._build_outline()
+        interior = self._interior
+        row = character.input_coord.row - self._interior_origin.row
+        column = character.input_coord.column - self._interior_origin.column
+        # Anything outside the mask has at least one neighbor that is not an input character
+        if not 0 <= row < len(interior) or column < 0:
+            return True
+        return not interior[row] >> column & 1
+
+    def _build_outline(self) -> list[int]:
+        """Classify every input character as outline or interior in a single pass.
+
+        Returns:
+            list[int]: Interior cells as one bitmask per row, starting at `_interior_origin`.
+        """
+        coords = [char.input_coord for char in self.terminal.get_characters()]
+        if not coords:
+            return []
+
+        # Leave an empty row/column around the text so neighbor checks never go out of bounds
+        min_row = min(coord.row for coord in coords) - 1
+        min_col = min(coord.column for coord in coords) - 1
+        max_row = max(coord.row for coord in coords) + 1
+        self._interior_origin = Coord(min_col, min_row)
+        occupancy = [0] * (max_row - min_row + 1)
+        for coord in coords:
+            occupancy[coord.row - min_row] |= 1 << (coord.column - min_col)
 
-        # If any neighbor is a space (or doesn't exist), this is an outline character
-        all_chars = {char.input_coord: char for char in self.terminal.get_characters()}
-        for neighbor_coord in neighbors:
-            if neighbor_coord not in all_chars:
-                return True  # Edge of text = outline
-        return False
+        return _interior_mask(occupancy)
 
     def build(self) -> None:
         """Build the initial state of the effect."""
         # Get input text characters and store them
-        terminal_width = self.terminal.canvas.right - self.terminal.canvas.left + 1
-        center_col = self.terminal.canvas.left + terminal_width // 2
+        center_col = self._left + self._width // 2
 
         for idx, character in enumerate(self.terminal.get_characters()):
             character.layer = 3  # Above tree and snow
@@ -182,131 +381,109 @@ class ChristmasIterator(BaseEffectIterator[ChristmasConfig]):
 
             # Slide in from sides effect
             if final_pos.column < center_col:
-                start_col = self.terminal.canvas.left - 5  # Off-screen left
+                start_col = self._left - 5  # Off-screen left
             else:
-                start_col = self.terminal.canvas.right + 5  # Off-screen right
+                start_col = self._right + 5  # Off-screen right
 
             character.motion.set_coordinate(Coord(start_col, final_pos.row))
 
             # Create slide path to original position
             slide_path = character.motion.new_path(speed=0.4, ease=easing.out_back)
             slide_path.new_waypoint(final_pos)
+            character.event_handler.register_event(
+                character.event_handler.Event.PATH_COMPLETE,
+                slide_path,
+                character.event_handler.Action.CALLBACK,
+                character.event_handler.Callback(self._input_char_settled),
+            )
             character.motion.activate_path(slide_path)
+            self.moving_input_count += 1
 
             # Gold/yellow color like the star
-            scene = character.animation.new_scene()
-            scene.add_frame(character.input_symbol, 1, colors=ColorPair(fg=Color("ffd700")))
-            character.animation.activate_scene(scene)
+            character.animation.activate_scene(_new_solid_scene(character, character.input_symbol, _GOLD_COLOR))
 
             self.input_chars.append(character)
 
-        # Christmas tree ASCII art
-        tree_lines = [
-            "                        ,",
-            "                      _/^\\_",
-            "                     <     >",
-            "                      /.-.\\         ",
-            "                      `/&\\`                   ",
-            "                     ,@.*;@,",
-            "                    /_o.I %_\\     ",
-            "                   (`'--:o(_@;",
-            "                  /`;--.,__ `')              ",
-            "                 ;@`o % O,*`'`&\\ ",
-            "                (`'--)_@ ;o %'()\\       ",
-            "                /`;--._`''--._O'@;",
-            "               /&*,()~o`;-.,_ `\"\"\")",
-            "               /`,@ ;+& () o*`;-';\\",
-            "              (`\"\"--.,_0 +% @' &()\\",
-            "              /-.,_    ``''--....-'`)",
-            "              /@%;o`:;'--,.__   __.\'\\",
-            "             ;*,&(); @ % &^;~`\"`o;@();          ",
-            "             /(); o^~; & ().o@*&`;&%O\\",
-            "             `\"=\"==\"\"==,,,.,=\"==\"===\"`",
-            "          __.----.---''#####---...___...-----._",
-            "        '`            `\"\"\"\"\"`",
-        ]
-
-        # Ornament symbols that get bright colors
-        ornament_symbols = {'*', '@', '&', '%', 'O', 'o', '+'}
-        ornament_colors = [
-            Color("ff0000"),  # Red
-            Color("ff69b4"),  # Pink
-            Color("ffd700"),  # Gold
-            Color("00ffff"),  # Cyan
-            Color("ff00ff"),  # Magenta
-            Color("ff8c00"),  # Dark orange
-        ]
-
         # Calculate horizontal center
-        terminal_width = self.terminal.canvas.right - self.terminal.canvas.left + 1
-        center_col = self.terminal.canvas.left + terminal_width // 2
+        center_col = self._left + self._width // 2
 
         # Calculate tree positioning
-        tree_height = len(tree_lines)
-        max_line_width = max(len(line) for line in tree_lines)
-        start_col = center_col - max_line_width // 2
+        start_col = center_col - _TREE_WIDTH // 2
+
+        # Draw every bauble color in one batch
+        bauble_colors = iter(self._rng.choices(_ORNAMENT_COLORS, k=_TREE_CATEGORIES.count(_BAUBLE)))
 
         # Create tree characters - build from bottom with dull colors
-        self.tree_chars = []  # Store for later color change
+        # Tree characters with their bright scenes and whether they light up, kept as parallel lists
+        self.tree_chars: list[EffectCharacter] = []
+        self.tree_bright_scenes: list[Scene] = []
+        self.tree_is_light: list[bool] = []
         char_with_rows = []  # Store (character, final_row) for sorting
 
-        for line_index, line in enumerate(tree_lines):
-            # Trunk (last line) at bottom, star (first line) higher up
-            reversed_index = tree_height - 1 - line_index
-            row = self.terminal.canvas.bottom + reversed_index
-
-            for col_offset, char in enumerate(line):
-                if char != ' ':  # Skip spaces
-                    col = start_col + col_offset
-
-                    tree_char = self.terminal.add_character(char, Coord(col, row))
-
-                    # Determine colors - dull while building, bright when complete
-                    is_star = line_index < 4  # Include one more line for the star
-                    is_trunk = line_index >= tree_height - 2 or '#' in char
-                    is_bauble = char in ornament_symbols
-
-                    if is_star:
-                        dull_color = Color("6b6b5a")  # Dull gray-gold
-                        bright_color = Color("ffd700")  # Bright gold
-                    elif is_trunk:
-                        dull_color = Color("8b4513")  # Brown (same)
-                        bright_color = Color("8b4513")
-                    elif is_bauble:
-                        dull_color = Color("4a4a4a")  # Dull gray
-                        bright_color = random.choice(ornament_colors)  # Bright color
-                    else:
-                        dull_color = Color("228b22")  # Green (same)
-                        bright_color = Color("228b22")
-
-                    # Create dull scene (building)
-                    dull_scene = tree_char.animation.new_scene()
-                    dull_scene.add_frame(char, 1, colors=ColorPair(fg=dull_color))
-
-                    # Create bright scene (complete)
-                    bright_scene = tree_char.animation.new_scene()
-                    bright_scene.add_frame(char, 1, colors=ColorPair(fg=bright_color))
-
-                    # Start with dull color
-                    tree_char.animation.activate_scene(dull_scene)
-
-                    # Create slide-down animation
-                    # Start character at top, slide down to final position
-                    start_row = self.terminal.canvas.top
-                    tree_char.motion.set_coordinate(Coord(col, start_row))
-
-                    # Create path from top to final position
-                    slide_path = tree_char.motion.new_path(speed=0.3, ease=easing.out_quad)
-                    slide_path.new_waypoint(Coord(col, row))
-                    tree_char.motion.activate_path(slide_path)
-
-                    # Store character with its bright scene for later
-                    self.tree_chars.append((tree_char, bright_scene, is_star or is_bauble))
-                    char_with_rows.append((tree_char, row))
+        for char, row_offset, col_offset, category in zip(
+            _TREE_SYMBOLS, _TREE_ROW_OFFSETS, _TREE_COL_OFFSETS, _TREE_CATEGORIES
+        ):
+            col = start_col + col_offset
+            row = self._bottom + row_offset
+
+            tree_char = self.terminal.add_character(char, Coord(col, row))
+
+            # Determine colors - dull while building, bright when complete
+            dull_color, bright_color = _TREE_CATEGORY_COLORS[category]
+            if bright_color is None:
+                bright_color = next(bauble_colors)
+
+            # Create dull scene (building)
+            dull_scene = _new_solid_scene(tree_char, char, dull_color)
+
+            # Create bright scene (complete)
+            bright_scene = _new_solid_scene(tree_char, char, bright_color)
+
+            # Start with dull color
+            tree_char.animation.activate_scene(dull_scene)
+
+            # Create slide-down animation
+            # Start character at top, slide down to final position
+            start_row = self._top
+            tree_char.motion.set_coordinate(Coord(col, start_row))
+
+            # Create path from top to final position
+            slide_path = tree_char.motion.new_path(speed=0.3, ease=easing.out_quad)
+            slide_path.new_waypoint(Coord(col, row))
+            tree_char.event_handler.register_event(
+                tree_char.event_handler.Event.PATH_COMPLETE,
+                slide_path,
+                tree_char.event_handler.Action.CALLBACK,
+                tree_char.event_handler.Callback(self._tree_char_settled),
+            )
+            tree_char.motion.activate_path(slide_path)
+            self.moving_tree_count += 1
+
+            # Store character with its bright scene for later
+            self.tree_chars.append(tree_char)
+            self.tree_bright_scenes.append(bright_scene)
+            self.tree_is_light.append(category in (_STAR, _BAUBLE))
+            char_with_rows.append((tree_char, row))
 
         # Sort by final row (ascending = bottom first, since bottom is smallest number)
         char_with_rows.sort(key=lambda x: x[1])
-        self.pending_chars = [char for char, _ in char_with_rows]
+        self.pending_chars = deque(char for char, _ in char_with_rows)
+
+    def _input_char_settled(self, character: EffectCharacter) -> None:
+        """Record that an input character finished sliding into place.
+
+        Args:
+            character: The character that settled.
+        """
+        self.moving_input_count -= 1
+
+    def _tree_char_settled(self, character: EffectCharacter) -> None:
+        """Record that a tree character finished sliding into place.
+
+        Args:
+            character: The character that settled.
+        """
+        self.moving_tree_count -= 1
 
     def spawn_background_snowflake(self, speed_multiplier: float = 1.0) -> None:
         """Spawn a background snowflake that falls to the bottom.
@@ -314,186 +491,278 @@ class ChristmasIterator(BaseEffectIterator[ChristmasConfig]):
         Args:
             speed_multiplier: Multiplier for the falling speed (default 1.0).
         """
-        snow_col = random.randint(self.terminal.canvas.left, self.terminal.canvas.right)
-        snow_char = self.terminal.add_character(" ", Coord(snow_col, self.terminal.canvas.top))
+        left, right, top = self._left, self._right, self._top
+
+        if not self._spawn_draws:
+            self._draw_spawns()
+        snow_col, snow_symbol, snow_color, speed_factor, sway_template = self._spawn_draws.pop()
+
+        snow_char = self.terminal.add_character(" ", Coord(snow_col, top))
         snow_char.layer = 1  # Behind text characters
 
         # Snow appearance
-        snow_symbol = random.choice(self.config.snow_symbols)
-        snow_color = random.choice(self.config.snow_colors)
-        snow_scene = snow_char.animation.new_scene()
-        snow_scene.add_frame(snow_symbol, 1, colors=ColorPair(fg=snow_color))
-        snow_char.animation.activate_scene(snow_scene)
+        snow_char.animation.activate_scene(_new_solid_scene(snow_char, snow_symbol, snow_color))
 
         # Set starting position at top
-        snow_char.motion.set_coordinate(Coord(snow_col, self.terminal.canvas.top))
+        snow_char.motion.set_coordinate(Coord(snow_col, top))
 
         # Create falling path with gentle swaying
-        snowflake_speed = self.config.movement_speed * random.uniform(0.7, 1.3) * speed_multiplier
+        snowflake_speed = self.config.movement_speed * speed_factor * speed_multiplier
         fall_path = snow_char.motion.new_path(speed=snowflake_speed, ease=easing.in_out_sine)
 
-        # Add sway waypoints for natural movement
-        num_sways = random.randint(2, 4)
-        fall_distance = self.terminal.canvas.top - self.terminal.canvas.bottom
-        current_column = snow_col
-
-        for i in range(1, num_sways):
-            progress = i / num_sways
-            sway_row = self.terminal.canvas.top - int(fall_distance * progress)
-            sway_direction = 1 if i % 2 == 0 else -1
-            sway_amount = random.randint(1, 3)
-            current_column = current_column + (sway_direction * sway_amount)
-            sway_column = max(self.terminal.canvas.left, min(self.terminal.canvas.right, current_column))
-            fall_path.new_waypoint(Coord(sway_column, sway_row))
-
-        # Final waypoint at bottom
-        final_column = max(self.terminal.canvas.left, min(self.terminal.canvas.right, current_column))
-        fall_path.new_waypoint(Coord(final_column, self.terminal.canvas.bottom))
+        # Add sway waypoints for natural movement, keeping them on the canvas
+        for column_offset, row in sway_template:
+            fall_path.new_waypoint(Coord(max(left, min(right, snow_col + column_offset)), row))
 
         snow_char.motion.activate_path(fall_path)
         self.terminal.set_character_visibility(snow_char, is_visible=True)
         self.active_characters.add(snow_char)
         self.background_snow.append(snow_char)
 
+    def _draw_spawns(self) -> None:
+        """Draw the random parameters for the next batch of background snowflakes at once."""
+        count = _SPAWN_DRAW_BATCH
+        self._spawn_draws = list(
+            zip(
+                self._rng.choices(range(self._left, self._right + 1), k=count),
+                self._rng.choices(self.config.snow_symbols, k=count),
+                self._rng.choices(self.config.snow_colors, k=count),
+                [0.7 + 0.6 * self._random() for _ in range(count)],  # Speed varies from 0.7x to 1.3x
+                self._rng.choices(self._sway_templates, k=count),
+            )
+        )
+
+    def _new_sway_template(self) -> tuple[tuple[int, int], ...]:
+        """Generate a background snow sway trajectory relative to the flake's starting column.
+
+        Returns:
+            tuple[tuple[int, int], ...]: (column offset, row) waypoints from the first sway down to the bottom.
+        """
+        top, bottom = self._top, self._bottom
+        num_sways = self._randint(2, 4)
+        fall_distance = top - bottom
+        column_offset = 0
+        waypoints: list[tuple[int, int]] = []
+
+        for i, sway_amount in enumerate(self._rng.choices(_SWAY_AMOUNTS, k=num_sways - 1), start=1):
+            progress = i / num_sways
+            sway_row = top - int(fall_distance * progress)
+            sway_direction = (1, -1)[i & 1]  # Alternate right and left
+            column_offset += sway_direction * sway_amount
+            waypoints.append((column_offset, sway_row))
+
+        # Final waypoint at bottom, below the last sway
+        waypoints.append((column_offset, bottom))
+        return tuple(waypoints)
+
     def check_background_snow_landing(self) -> None:
         """Check if background snow has landed and stack it."""
-        for snow in list(self.background_snow):
-            if not snow.motion.active_path:
-                # If spawning has stopped, just remove snow without stacking
-                if self.spawn_stopped:
-                    self.terminal.set_character_visibility(snow, is_visible=False)
-                    self.background_snow.remove(snow)
-                else:
-                    snow_coord = snow.motion.current_coord
-                    landing_column = snow_coord.column
-
-                    if landing_column not in self.bottom_pile_height:
-                        self.bottom_pile_height[landing_column] = 0
-
-                    # Stack snow at bottom (max height 5) - subtract to stack upward
-                    if self.bottom_pile_height[landing_column] < 5:
-                        stacked_row = self.terminal.canvas.bottom - self.bottom_pile_height[landing_column]
-                        snow.motion.set_coordinate(Coord(landing_column, stacked_row))
-                        self.bottom_pile_height[landing_column] += 1
-                    else:
-                        # Pile is full, remove this snowflake
-                        self.terminal.set_character_visibility(snow, is_visible=False)
-                        self.background_snow.remove(snow)
-
-    def __next__(self) -> str:
-        """Return the next frame in the animation."""
-        # Build tree from bottom to top - slowly
-        if self.pending_chars:
-            if self.text_spawn_delay <= 0:
-                # Release 1-2 characters at a time for slow build
-                num_to_spawn = min(random.randint(1, 2), len(self.pending_chars))
-                for _ in range(num_to_spawn):
-                    if self.pending_chars:
-                        # Pop from front (bottom characters first)
-                        next_character = self.pending_chars.pop(0)
-                        self.terminal.set_character_visibility(next_character, is_visible=True)
-                        self.active_characters.add(next_character)
-                self.text_spawn_delay = 2  # Delay between spawns
+        left, bottom = self._left, self._bottom
+        pile = self.bottom_pile_height
+
+        # Rebuild the list in one pass rather than removing landed snow in place
+        survivors: list[EffectCharacter] = []
+        for snow in self.background_snow:
+            if snow.motion.active_path:
+                survivors.append(snow)
+                continue
+
+            snow_coord = snow.motion.current_coord
+            landing_column = snow_coord.column
+            pile_index = landing_column - left
+            pile_height = pile[pile_index]
+
+            # Stack snow at bottom (max height 5) - subtract to stack upward
+            if pile_height < 5:
+                stacked_row = bottom - pile_height
+                snow.motion.set_coordinate(Coord(landing_column, stacked_row))
+                pile[pile_index] = pile_height + 1
+                survivors.append(snow)
             else:
-                self.text_spawn_delay -= 1
-
-        elif not self.text_complete:
-            # Check if all tree characters have finished their animations
-            all_settled = True
-            for tree_char, _, _ in self.tree_chars:
-                if tree_char.motion.active_path:
-                    all_settled = False
-                    break
-
-            if all_settled:
-                # Tree is fully built and settled - prepare to light up baubles and star!
-                self.text_complete = True
-                # Collect lights to activate (baubles and star)
-                lights = []
-                for tree_char, bright_scene, should_pop in self.tree_chars:
-                    if should_pop:  # Only baubles and star
-                        row = tree_char.motion.current_coord.row
-                        lights.append((row, tree_char, bright_scene))
-                # Sort by row (ascending = bottom first)
-                lights.sort(key=lambda x: x[0])
-                self.lights_to_activate = [(char, scene) for _, char, scene in lights]
-
-        # Light up baubles one by one
-        if self.text_complete and self.lights_to_activate:
+                # Pile is full, remove this snowflake
+                self.terminal.set_character_visibility(snow, is_visible=False)
+        self.background_snow = survivors
+
+    def _build_tree(self) -> None:
+        """Release tree characters from the bottom up, slowly."""
+        if self.text_spawn_delay <= 0:
+            # Release 1-2 characters at a time for slow build
+            num_to_spawn = min(self._randint(1, 2), len(self.pending_chars))
+            for _ in range(num_to_spawn):
+                # Pop from front (bottom characters first)
+                next_character = self.pending_chars.popleft()
+                self.terminal.set_character_visibility(next_character, is_visible=True)
+                self.active_characters.add(next_character)
+            self.text_spawn_delay = 2  # Delay between spawns
+        else:
+            self.text_spawn_delay -= 1
+
+        if not self.pending_chars:
+            self._phase = self._wait_for_tree
+
+    def _wait_for_tree(self) -> None:
+        """Wait for the tree to settle, then queue up the lights."""
+        # Check if all tree characters have finished their animations
+        if self.moving_tree_count:
+            return
+
+        # Tree is fully built and settled - prepare to light up baubles and star!
+        self.text_complete = True
+        # Keep the next spawn check on the same frame but reschedule the spawn with the lower chance
+        self.background_spawn_delay = self.background_spawn_delay % 4 + 4 * self._failed_spawn_checks(0.15)
+        self._snowfall = self._snow_after_tree
+        # Collect lights to activate (only baubles and star)
+        lights = list(compress(zip(self.tree_chars, self.tree_bright_scenes), self.tree_is_light))
+        # Sort by row (ascending = bottom first)
+        lights.sort(key=lambda light: light[0].motion.current_coord.row)
+        self.lights_to_activate = deque(lights)
+
+        self._phase = self._light_up
+        self._light_up()
+
+    def _light_up(self) -> None:
+        """Light up baubles one by one, then reveal the input text."""
+        if self.lights_to_activate:
             if self.light_delay <= 0:
                 # Light up 1 bauble/light
-                if self.lights_to_activate:
-                    char, scene = self.lights_to_activate.pop(0)
-                    char.animation.activate_scene(scene)
+                char, scene = self.lights_to_activate.popleft()
+                char.animation.activate_scene(scene)
                 self.light_delay = 3  # Delay between each light
             else:
                 self.light_delay -= 1
 
-        # Reveal input text after lights are done
-        if self.text_complete and not self.lights_to_activate and not self.input_chars_revealed:
+        if not self.lights_to_activate:
+            # Reveal input text after lights are done
             self.input_chars_revealed = True
             for character in self.input_chars:
                 self.terminal.set_character_visibility(character, is_visible=True)
                 self.active_characters.add(character)
 
-        # Accelerate snow when omarchy animation completes
-        if self.input_chars_revealed and not self.snow_accelerated:
-            # Check if all input characters have finished their animations
-            all_omarchy_settled = True
-            for character in self.input_chars:
-                if character.motion.active_path:
-                    all_omarchy_settled = False
-                    break
-
-            if all_omarchy_settled:
-                self.snow_accelerated = True
-                # Speed up all existing background snow by 50%
-                for snow in self.background_snow:
-                    if snow.motion.active_path:
-                        # Get current position
-                        current_pos = snow.motion.current_coord
-                        # Create new faster path from current position to bottom
-                        faster_speed = self.config.movement_speed * 2.5  # 50% faster than current 2x
-                        new_path = snow.motion.new_path(speed=faster_speed, ease=easing.in_quad)
-                        new_path.new_waypoint(Coord(current_pos.column, self.terminal.canvas.bottom))
-                        snow.motion.activate_path(new_path)
+            self._phase = self._wait_for_text
+            self._wait_for_text()
+
+    def _wait_for_text(self) -> None:
+        """Accelerate snow once the omarchy animation completes."""
+        # Check if all input characters have finished their animations
+        if self.moving_input_count:
+            return
+
+        self.snow_accelerated = True
+        # Speed up all existing background snow by 50%
+        for snow in self.background_snow:
+            if snow.motion.active_path:
+                # Get current position
+                current_pos = snow.motion.current_coord
+                # Create new faster path from current position to bottom
+                faster_speed = self.config.movement_speed * 2.5  # 50% faster than current 2x
+                new_path = snow.motion.new_path(speed=faster_speed, ease=easing.in_quad)
+                new_path.new_waypoint(Coord(current_pos.column, self._bottom))
+                snow.motion.activate_path(new_path)
+
+        self._phase = self._tree_done
+
+    def _tree_done(self) -> None:
+        """Nothing left to do for the tree and text; only the snow keeps going."""
+
+    def _failed_spawn_checks(self, spawn_chance: float) -> int:
+        """Sample how many spawn checks fail before the next one succeeds.
+
+        Rolling `random() < spawn_chance` at every check gives a geometric number of failures, so one draw per
+        spawn replaces one draw per check.
+
+        Args:
+            spawn_chance: Chance that a single spawn check succeeds.
+
+        Returns:
+            int: The number of failed checks before the next spawn.
+        """
+        return int(math.log(1.0 - self._random()) / math.log(1.0 - spawn_chance))
+
+    def _snow_while_building(self) -> None:
+        """Spawn moderate background snow while the tree is building."""
+        if self.background_spawn_delay <= 0:
+            self.spawn_background_snowflake()
+            # Check every 4 frames with a 25% chance to spawn
+            self.background_spawn_delay = 3 + 4 * self._failed_spawn_checks(0.25)
+        else:
+            self.background_spawn_delay -= 1
+
+    def _snow_after_tree(self) -> None:
+        """Spawn gentle continuous snow after the tree is complete, then stop spawning."""
+        self.fadeout_counter += 1
+        if self.fadeout_counter > 600:  # Keep tree visible for ~5 seconds before stopping
+            self.spawn_stopped = True
+            self._snowfall = self._snow_stopped
+        elif self.background_spawn_delay <= 0:
+            # Speed up snow after omarchy is revealed
+            speed = 2.0 if self.input_chars_revealed else 1.0
+            self.spawn_background_snowflake(speed_multiplier=speed)
+            # Check every 4 frames with a 15% chance to spawn
+            self.background_spawn_delay = 3 + 4 * self._failed_spawn_checks(0.15)
+        else:
+            self.background_spawn_delay -= 1
+
+    def _snow_stopped(self) -> None:
+        """Spawning has stopped; the remaining snow just falls out."""
+
+    def _snowing_frame(self) -> str:
+        """Produce a frame while background snow is still spawning and piling up.
+
+        Returns:
+            str: The next frame.
+        """
+        # Advance the tree and text through build, lights, reveal and snow acceleration
+        self._phase()
 
         # Spawn background snowflakes - gentle continuous snow
-        if not self.spawn_stopped:
-            if self.text_complete:
-                self.fadeout_counter += 1
-                if self.fadeout_counter > 600:  # Keep tree visible for ~5 seconds before stopping
-                    self.spawn_stopped = True
-                else:
-                    if self.background_spawn_delay <= 0:
-                        # After tree complete: gentle continuous snow
-                        # Speed up snow after omarchy is revealed
-                        speed = 2.0 if self.input_chars_revealed else 1.0
-                        if random.random() < 0.15:  # 15% chance to spawn
-                            self.spawn_background_snowflake(speed_multiplier=speed)
-                        self.background_spawn_delay = 3
-                    else:
-                        self.background_spawn_delay -= 1
-            else:
-                # While building tree - moderate background snow
-                if self.background_spawn_delay <= 0:
-                    if random.random() < 0.25:  # 25% chance to spawn
-                        self.spawn_background_snowflake()
-                    self.background_spawn_delay = 3  # Shorter delay
-                else:
-                    self.background_spawn_delay -= 1
+        self._snowfall()
+        if self.spawn_stopped:
+            # Spawning stopped this frame - from now on only drain the remaining snow
+            self._next_frame = self._draining_frame
+            return self._drain_background_snow()
 
         # Check background snow landing
         self.check_background_snow_landing()
 
-        # End when spawning stopped and all background snow is gone
-        if self.spawn_stopped and len(self.background_snow) == 0:
+        # Keep animation running
+        self.update()
+        return self.frame
+
+    def _draining_frame(self) -> str:
+        """Produce a frame after spawning has stopped.
+
+        Returns:
+            str: The next frame.
+        """
+        self._phase()
+        return self._drain_background_snow()
+
+    def _drain_background_snow(self) -> str:
+        """Remove background snow as it lands, without stacking, and end once it is all gone.
+
+        Returns:
+            str: The next frame.
+        """
+        survivors: list[EffectCharacter] = []
+        for snow in self.background_snow:
+            if snow.motion.active_path:
+                survivors.append(snow)
+            else:
+                self.terminal.set_character_visibility(snow, is_visible=False)
+        self.background_snow = survivors
+
+        # End when all background snow is gone
+        if not self.background_snow:
             raise StopIteration
 
         # Keep animation running
         self.update()
         return self.frame
 
+    def __next__(self) -> str:
+        """Return the next frame in the animation."""
+        return self._next_frame()
+
 
 class Christmas(BaseEffect[ChristmasConfig]):
     """Snow falls and accumulates, gradually revealing the text.
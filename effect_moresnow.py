@@ -8,9 +8,11 @@ Classes:
 
 from __future__ import annotations
 
+import math
 import random
-import time
+from collections import deque
 from dataclasses import dataclass
+from itertools import islice
 
 from terminaltexteffects import Color, Coord, EffectCharacter, Gradient, easing
 from terminaltexteffects.engine.base_config import BaseConfig
@@ -19,6 +21,89 @@ from terminaltexteffects.utils import argutils
 from terminaltexteffects.utils.argutils import ArgSpec, ParserSpec
 from terminaltexteffects.utils.graphics import ColorPair
 
+# Landed text colors, alternating by row: white, Christmas green, Christmas red
+_LANDED_COLOR_PAIRS = (
+    ColorPair(fg=Color("ffffff")),
+    ColorPair(fg=Color("33cc33")),
+    ColorPair(fg=Color("ff6666")),
+)
+
+# Number of precomputed background snow sway trajectories to pick from
+_SWAY_TEMPLATE_COUNT = 32
+# Number of background snow speed factors drawn at once
+_SPEED_FACTOR_BATCH = 256
+# Number of pre-drawn background snow batch sizes, cycled through while snowing (power of two)
+_SPAWN_COUNT_RING_SIZE = 1024
+
+
+def _interior_mask(occupancy: list[int]) -> list[int]:
+    """Compute the interior cells of a padded per-row occupancy bitmask.
+
+    A cell is interior when all 4 neighbors (up, down, left, right) are occupied, whether or not the
+    cell itself is. Whole rows are shifted and AND-ed together so every cell in a row is tested at once.
+
+    Args:
+        occupancy (list[int]): Occupied cells as one bitmask per row, with an empty row/column of padding.
+
+    Returns:
+        list[int]: Interior cells as one bitmask per row, in the same layout as `occupancy`.
+
+    """
+    interior = [0] * len(occupancy)
+    for row in range(1, len(occupancy) - 1):
+        cells = occupancy[row]
+        interior[row] = occupancy[row - 1] & occupancy[row + 1] & (cells << 1) & (cells >> 1)
+    return interior
+
+
+# In/out sine easing sampled at 257 evenly spaced points, shared by every snowflake path
+_EASE_LUT: tuple[float, ...] = tuple((1 - math.cos(math.pi * i / 256)) / 2 for i in range(257))
+
+
+def _ease_lut(progress_ratio: float) -> float:
+    """Ease in/out like `easing.in_out_sine`, reading the precomputed table instead of calling cos().
+
+    Args:
+        progress_ratio (float): the ratio of the current step to the maximum steps
+
+    Returns:
+        float: 0 <= n <= 1 eased value
+
+    """
+    return _EASE_LUT[int(progress_ratio * 256 + 0.5)]
+
+
+def _sway_waypoints(
+    column: int, top: int, bottom: int, left: int, right: int, sway_amounts: list[int]
+) -> list[Coord]:
+    """Compute the sway waypoints of a snowflake falling from the top of the canvas.
+
+    The flake drifts alternately left and right by each sway amount, at rows evenly spaced
+    between `top` and `bottom`.
+
+    Args:
+        column (int): Starting column of the flake.
+        top (int): Row the flake starts falling from.
+        bottom (int): Row the flake falls to.
+        left (int): Leftmost column a waypoint may use.
+        right (int): Rightmost column a waypoint may use.
+        sway_amounts (list[int]): Columns to drift for each sway.
+
+    Returns:
+        list[Coord]: One waypoint per sway, not including the final waypoint.
+
+    """
+    num_sways = len(sway_amounts) + 1
+    fall_distance = top - bottom
+    waypoints: list[Coord] = []
+    for i, sway_amount in enumerate(sway_amounts, start=1):
+        progress = i / num_sways
+        sway_row = top - int(fall_distance * progress)
+        sway_direction = 1 if i % 2 == 0 else -1
+        column = column + (sway_direction * sway_amount)
+        waypoints.append(Coord(max(left, min(right, column)), sway_row))
+    return waypoints
+
 
 def get_effect_resources() -> tuple[str, type[BaseEffect], type[BaseConfig]]:
     """Get the command, effect class, and configuration class for the effect.
@@ -129,13 +214,30 @@ class MoreSnowIterator(BaseEffectIterator[MoreSnowConfig]):
         """
         super().__init__(effect)
         self.pending_chars: list[EffectCharacter] = []
-        self.background_snow: list[EffectCharacter] = []
-        self.bottom_pile_height: dict[int, int] = {}
+        self.background_snow: set[EffectCharacter] = set()  # Background snow that is still falling
+        self._landed_snow: deque[EffectCharacter] = deque()  # Background snow that landed since the last frame
+        self._stacked_snow: list[EffectCharacter] = []  # Landed background snow still shown on the pile
+        # Snow pile height per canvas column, indexed by column - canvas.left
+        self.bottom_pile_height: bytearray = bytearray(self.terminal.canvas.right - self.terminal.canvas.left + 1)
+        # Interior cell bitmask per row, padded by one cell - built on first use by is_outline_character
+        self._interior: list[int] | None = None
+        self._interior_origin: Coord = Coord(0, 0)
         self.text_spawn_delay: int = 0
         self.background_spawn_delay: int = 0
         self.text_complete: bool = False
         self.fadeout_counter: int = 0
         self.spawn_stopped: bool = False
+        self.falling_text_count: int = 0  # Text characters that have not landed yet
+        self._speed_factors: list[float] = []  # Pre-drawn background snow speed factors (0.7x to 1.3x)
+        # Pre-drawn background snow batch sizes (3-6 flakes), read in a ring
+        self._spawn_counts: list[int] = random.choices(range(3, 7), k=_SPAWN_COUNT_RING_SIZE)
+        self._spawn_count_index: int = 0
+        # One shared ColorPair per snow color
+        self._color_pairs: dict[Color, ColorPair] = {color: ColorPair(fg=color) for color in self.config.snow_colors}
+        # (column offset, row) waypoints for background snow, translated to each flake's column
+        self._sway_templates: list[tuple[tuple[int, int], ...]] = [
+            self._new_sway_template() for _ in range(_SWAY_TEMPLATE_COUNT)
+        ]
         self.build()
 
     def is_outline_character(self, character: EffectCharacter) -> bool:
@@ -147,159 +249,217 @@ class MoreSnowIterator(BaseEffectIterator[MoreSnowConfig]):
         Returns:
             bool: True if character is on the outline, False if interior.
         """
-        coord = character.input_coord
-        # Check all 4 neighbors (up, down, left, right)
-        neighbors = [
-            Coord(coord.column, coord.row - 1),  # up
-            Coord(coord.column, coord.row + 1),  # down
-            Coord(coord.column - 1, coord.row),  # left
-            Coord(coord.column + 1, coord.row),  # right
-        ]
+        if self._interior is None:
+            self._interior = self._build_outline()
+        interior = self._interior
+        row = character.input_coord.row - self._interior_origin.row
+        column = character.input_coord.column - self._interior_origin.column
+        # Anything outside the mask has at least one neighbor that is not an input character
+        if not 0 <= row < len(interior) or column < 0:
+            return True
+        return not interior[row] >> column & 1
+
+    def _build_outline(self) -> list[int]:
+        """Classify every input character as outline or interior in a single pass.
 
-        # If any neighbor is a space (or doesn't exist), this is an outline character
-        all_chars = {char.input_coord: char for char in self.terminal.get_characters()}
-        for neighbor_coord in neighbors:
-            if neighbor_coord not in all_chars:
-                return True  # Edge of text = outline
-        return False
+        Returns:
+            list[int]: Interior cells as one bitmask per row, starting at `_interior_origin`.
+        """
+        coords = [char.input_coord for char in self.terminal.get_characters()]
+        if not coords:
+            return []
 
-    def build(self) -> None:
-        """Build the initial state of the effect."""
-        # Get all characters sorted by position (top to bottom, left to right)
-        all_chars = sorted(self.terminal.get_characters(), key=lambda c: (c.input_coord.row, c.input_coord.column))
+        # Leave an empty row/column around the text so neighbor checks never go out of bounds
+        min_row = min(coord.row for coord in coords) - 1
+        min_col = min(coord.column for coord in coords) - 1
+        max_row = max(coord.row for coord in coords) + 1
+        self._interior_origin = Coord(min_col, min_row)
+        occupancy = [0] * (max_row - min_row + 1)
+        for coord in coords:
+            occupancy[coord.row - min_row] |= 1 << (coord.column - min_col)
 
-        # Create index mapping for alternating colors
-        char_to_index = {char: idx for idx, char in enumerate(all_chars)}
+        return _interior_mask(occupancy)
 
+    def build(self) -> None:
+        """Build the initial state of the effect."""
         # Setup text characters - falling snow effect
-        for character in self.terminal.get_characters():
+        top, left, right = self.terminal.canvas.top, self.terminal.canvas.left, self.terminal.canvas.right
+        movement_speed = self.config.movement_speed
+        snow_colors = self.config.snow_colors
+        color_pairs = self._color_pairs
+        # Snow appearance while falling - exclude "." for text characters
+        text_snow_symbols = [s for s in self.config.snow_symbols if s != "."] or self.config.snow_symbols
+        text_landed = self._text_landed
+
+        # Draw the speed, sway count and sway amounts for every character up front
+        characters = self.terminal.get_characters()
+        speeds = [movement_speed * (0.7 + 0.6 * random.random()) for _ in characters]  # 0.7x to 1.3x
+        sway_counts = random.choices((2, 3, 4), k=len(characters))
+        sway_amounts = iter(random.choices((1, 2, 3), k=sum(sway_counts) - len(characters)))
+
+        for character, snowflake_speed, num_sways in zip(characters, speeds, sway_counts):
             character.layer = 2  # In front of background snow
+            input_coord = character.input_coord
 
-            # Snow appearance while falling - exclude "." for text characters
-            text_snow_symbols = [s for s in self.config.snow_symbols if s != "."]
-            snow_symbol = random.choice(text_snow_symbols) if text_snow_symbols else random.choice(self.config.snow_symbols)
-            snow_color = random.choice(self.config.snow_colors)
-            falling_scene = character.animation.new_scene()
-            falling_scene.add_frame(snow_symbol, 1, colors=ColorPair(fg=snow_color))
-
-            # Landed appearance - horizontal lines of white, green, red
-            landed_scene = character.animation.new_scene()
-            # Alternate colors by row: white, green, red, white, green, red...
-            row_mod = character.input_coord.row % 3
-            if row_mod == 0:
-                landed_color = Color("ffffff")  # White
-            elif row_mod == 1:
-                landed_color = Color("33cc33")  # Christmas green
-            else:  # row_mod == 2
-                landed_color = Color("ff6666")  # Christmas red
-            landed_scene.add_frame(character.input_symbol, 1, colors=ColorPair(fg=landed_color))
-
-            character.animation.activate_scene(falling_scene)
+            snow_symbol = random.choice(text_snow_symbols)
+            snow_color = random.choice(snow_colors)
+            character.animation.set_appearance(snow_symbol, color_pairs[snow_color])
 
             # Start above the canvas and fall to input position
-            character.motion.set_coordinate(Coord(character.input_coord.column, self.terminal.canvas.top))
+            character.motion.set_coordinate(Coord(input_coord.column, top))
 
             # Create falling path with swaying
-            snowflake_speed = self.config.movement_speed * random.uniform(0.7, 1.3)
-            fall_path = character.motion.new_path(speed=snowflake_speed, ease=easing.in_out_sine)
+            fall_path = character.motion.new_path(speed=snowflake_speed, ease=_ease_lut)
 
             # Add some sway waypoints
-            num_sways = random.randint(2, 4)
-            fall_distance = self.terminal.canvas.top - character.input_coord.row
-            current_column = character.input_coord.column
-
-            for i in range(1, num_sways):
-                progress = i / num_sways
-                sway_row = self.terminal.canvas.top - int(fall_distance * progress)
-                sway_direction = 1 if i % 2 == 0 else -1
-                sway_amount = random.randint(1, 3)
-                current_column = current_column + (sway_direction * sway_amount)
-                sway_column = max(self.terminal.canvas.left, min(self.terminal.canvas.right, current_column))
-                fall_path.new_waypoint(Coord(sway_column, sway_row))
+            for waypoint in _sway_waypoints(
+                input_coord.column, top, input_coord.row, left, right, list(islice(sway_amounts, num_sways - 1))
+            ):
+                fall_path.new_waypoint(waypoint)
 
             # Final waypoint at input position
-            fall_path.new_waypoint(character.input_coord)
+            fall_path.new_waypoint(input_coord)
 
-            # Switch to landed color when path completes
-            character.event_handler.register_event(
-                character.event_handler.Event.PATH_COMPLETE,
+            # Switch to landed color and count the character as landed when path completes
+            event_handler = character.event_handler
+            event_handler.register_event(
+                event_handler.Event.PATH_COMPLETE,
                 fall_path,
-                character.event_handler.Action.ACTIVATE_SCENE,
-                landed_scene,
+                event_handler.Action.CALLBACK,
+                event_handler.Callback(text_landed),
             )
 
             character.motion.activate_path(fall_path)
             self.pending_chars.append(character)
+        self.falling_text_count += len(characters)
+
+        # Release order is random, so shuffle once and pop from the end
+        random.shuffle(self.pending_chars)
 
-        # Sort by row (bottom to top) so bottom letters fill first
-        self.pending_chars.sort(key=lambda c: c.input_coord.row, reverse=True)
+    def _text_landed(self, character: EffectCharacter) -> None:
+        """Show a text character in its landed color and record that it finished falling.
 
-    def spawn_background_snowflake(self, speed_multiplier: float = 1.0) -> None:
-        """Spawn a background snowflake that falls to the bottom.
+        Landed text forms horizontal lines of white, green, red, alternating by row.
 
         Args:
+            character: The character that landed.
+        """
+        character.animation.set_appearance(character.input_symbol, _LANDED_COLOR_PAIRS[character.input_coord.row % 3])
+        self.falling_text_count -= 1
+
+    def spawn_background_snowflakes(self, count: int, speed_multiplier: float = 1.0) -> None:
+        """Spawn a batch of background snowflakes that fall to the bottom.
+
+        Args:
+            count: Number of snowflakes to spawn.
             speed_multiplier: Multiplier for the falling speed (default 1.0).
         """
-        snow_col = random.randint(self.terminal.canvas.left, self.terminal.canvas.right)
-        snow_char = self.terminal.add_character(" ", Coord(snow_col, self.terminal.canvas.top))
-        snow_char.layer = 1  # Behind text characters
+        terminal = self.terminal
+        top, left, right = terminal.canvas.top, terminal.canvas.left, terminal.canvas.right
+
+        # Draw the starting column, symbol, color and speed for the whole batch at once
+        columns = random.choices(range(left, right + 1), k=count)
+        symbols = random.choices(self.config.snow_symbols, k=count)
+        colors = random.choices(self.config.snow_colors, k=count)
+        base_speed = self.config.movement_speed * speed_multiplier
+        speed_factors = self._speed_factors
+        if len(speed_factors) < count:
+            speed_factors.extend([0.7 + 0.6 * random.random() for _ in range(_SPEED_FACTOR_BATCH)])
+        speeds = [base_speed * speed_factor for speed_factor in speed_factors[-count:]]
+        del speed_factors[-count:]
+        sway_templates = random.choices(self._sway_templates, k=count)
+        color_pairs = self._color_pairs
+        snow_landed = self._background_snow_landed
+
+        for snow_col, snow_symbol, snow_color, snowflake_speed, sway_template in zip(
+            columns, symbols, colors, speeds, sway_templates
+        ):
+            start_coord = Coord(snow_col, top)
+            snow_char = terminal.add_character(" ", start_coord)
+            snow_char.layer = 1  # Behind text characters
+
+            # Snow appearance - it never changes, so set it directly rather than building a scene
+            snow_char.animation.set_appearance(snow_symbol, color_pairs[snow_color])
+
+            # Set starting position at top
+            motion = snow_char.motion
+            motion.set_coordinate(start_coord)
+
+            # Create falling path with swaying - using same logic as text snow
+            fall_path = motion.new_path(speed=snowflake_speed, ease=_ease_lut)
+
+            # Add sway waypoints from the template, keeping them on the canvas
+            for column_offset, row in sway_template:
+                fall_path.new_waypoint(Coord(max(left, min(right, snow_col + column_offset)), row))
+
+            # Queue the flake for stacking when it reaches the bottom
+            event_handler = snow_char.event_handler
+            event_handler.register_event(
+                event_handler.Event.PATH_COMPLETE,
+                fall_path,
+                event_handler.Action.CALLBACK,
+                event_handler.Callback(snow_landed),
+            )
 
-        # Snow appearance
-        snow_symbol = random.choice(self.config.snow_symbols)
-        snow_color = random.choice(self.config.snow_colors)
-        snow_scene = snow_char.animation.new_scene()
-        snow_scene.add_frame(snow_symbol, 1, colors=ColorPair(fg=snow_color))
-        snow_char.animation.activate_scene(snow_scene)
+            motion.activate_path(fall_path)
+            terminal.set_character_visibility(snow_char, is_visible=True)
+            self.active_characters.add(snow_char)
+            self.background_snow.add(snow_char)
 
-        # Set starting position at top
-        snow_char.motion.set_coordinate(Coord(snow_col, self.terminal.canvas.top))
+    def _new_sway_template(self) -> tuple[tuple[int, int], ...]:
+        """Generate a background snow sway trajectory relative to the flake's starting column.
 
-        # Create falling path with swaying - using same logic as text snow
-        snowflake_speed = self.config.movement_speed * random.uniform(0.7, 1.3) * speed_multiplier
-        fall_path = snow_char.motion.new_path(speed=snowflake_speed, ease=easing.in_out_sine)
+        Uses the same sway as text snow, all the way down to the bottom of the canvas.
 
-        # Add sway waypoints - use subtraction like text snow does
+        Returns:
+            tuple[tuple[int, int], ...]: (column offset, row) waypoints from the first sway down to the bottom.
+        """
         num_sways = random.randint(2, 4)
-        fall_distance = self.terminal.canvas.top - self.terminal.canvas.bottom
-        current_column = snow_col
-
-        for i in range(1, num_sways):
-            progress = i / num_sways
-            sway_row = self.terminal.canvas.top - int(fall_distance * progress)
-            sway_direction = 1 if i % 2 == 0 else -1
-            sway_amount = random.randint(1, 3)
-            current_column = current_column + (sway_direction * sway_amount)
-            sway_column = max(self.terminal.canvas.left, min(self.terminal.canvas.right, current_column))
-            fall_path.new_waypoint(Coord(sway_column, sway_row))
-
-        # Final waypoint at bottom
-        final_column = max(self.terminal.canvas.left, min(self.terminal.canvas.right, current_column))
-        fall_path.new_waypoint(Coord(final_column, self.terminal.canvas.bottom))
-
-        snow_char.motion.activate_path(fall_path)
-        self.terminal.set_character_visibility(snow_char, is_visible=True)
-        self.active_characters.add(snow_char)
-        self.background_snow.append(snow_char)
+        sway_amounts = [random.randint(1, 3) for _ in range(num_sways - 1)]
+        # Bounds wide enough that offsets are never clamped here; each flake clamps after translating
+        max_offset = sum(sway_amounts)
+        waypoints = _sway_waypoints(
+            0, self.terminal.canvas.top, self.terminal.canvas.bottom, -max_offset, max_offset, sway_amounts
+        )
+
+        # Final waypoint at bottom, below the last sway
+        waypoints.append(Coord(waypoints[-1].column, self.terminal.canvas.bottom))
+        return tuple((waypoint.column, waypoint.row) for waypoint in waypoints)
+
+    def _background_snow_landed(self, character: EffectCharacter) -> None:
+        """Move a background snowflake that reached the bottom to the landing queue.
+
+        Args:
+            character: The snowflake that landed.
+        """
+        self.background_snow.discard(character)
+        self._landed_snow.append(character)
 
     def check_background_snow_landing(self) -> None:
-        """Check if background snow has landed and stack it."""
-        for snow in list(self.background_snow):
-            if not snow.motion.active_path:
-                snow_coord = snow.motion.current_coord
-                landing_column = snow_coord.column
-
-                if landing_column not in self.bottom_pile_height:
-                    self.bottom_pile_height[landing_column] = 0
-
-                # Stack snow at bottom (max height 5) - subtract to stack upward
-                if self.bottom_pile_height[landing_column] < 5:
-                    stacked_row = self.terminal.canvas.bottom - self.bottom_pile_height[landing_column]
-                    snow.motion.set_coordinate(Coord(landing_column, stacked_row))
-                    self.bottom_pile_height[landing_column] += 1
-                else:
-                    # Pile is full, remove this snowflake
-                    self.terminal.set_character_visibility(snow, is_visible=False)
-                    self.background_snow.remove(snow)
+        """Stack landed background snow on the pile."""
+        left, bottom = self.terminal.canvas.left, self.terminal.canvas.bottom
+        pile = self.bottom_pile_height
+
+        # Newly landed snow joins the flakes already on the pile
+        self._stacked_snow.extend(self._landed_snow)
+        self._landed_snow.clear()
+
+        # Single pass: keep stacked flakes, drop the ones that land on a full pile
+        survivors = []
+        for snow in self._stacked_snow:
+            landing_column = snow.motion.current_coord.column
+            pile_index = landing_column - left
+            pile_height = pile[pile_index]
+
+            # Stack snow at bottom (max height 5) - subtract to stack upward
+            if pile_height < 5:
+                snow.motion.set_coordinate(Coord(landing_column, bottom - pile_height))
+                pile[pile_index] = pile_height + 1
+                survivors.append(snow)
+            else:
+                # Pile is full, remove this snowflake
+                self.terminal.set_character_visibility(snow, is_visible=False)
+        self._stacked_snow = survivors
 
     def __next__(self) -> str:
         """Return the next frame in the animation."""
@@ -308,7 +468,7 @@ class MoreSnowIterator(BaseEffectIterator[MoreSnowConfig]):
             if self.text_spawn_delay <= 0:
                 # Release only 1 character at a time, less frequently
                 if self.pending_chars:
-                    next_character = self.pending_chars.pop(random.randint(0, len(self.pending_chars) - 1))
+                    next_character = self.pending_chars.pop()
                     self.terminal.set_character_visibility(next_character, is_visible=True)
                     self.active_characters.add(next_character)
                 self.text_spawn_delay = 1  # Delay between text snow
@@ -316,15 +476,7 @@ class MoreSnowIterator(BaseEffectIterator[MoreSnowConfig]):
                 self.text_spawn_delay -= 1
         elif not self.text_complete:
             # Check if all text characters have landed (completed their paths and turned red)
-            all_text_landed = not self.pending_chars
-            if all_text_landed:
-                # Check if any text characters still have active paths
-                for char in self.terminal.get_characters():
-                    if char.motion.active_path:
-                        all_text_landed = False
-                        break
-
-            if all_text_landed:
+            if self.falling_text_count == 0:
                 # Text completely filled with red, start fadeout
                 self.text_complete = True
                 # Speed up all existing background snow by creating new fast paths
@@ -336,6 +488,12 @@ class MoreSnowIterator(BaseEffectIterator[MoreSnowConfig]):
                         fast_speed = self.config.movement_speed * 5.0  # Half as fast (5x instead of 10x)
                         new_path = snow.motion.new_path(speed=fast_speed, ease=easing.in_quad)
                         new_path.new_waypoint(Coord(current_pos.column, self.terminal.canvas.bottom))
+                        snow.event_handler.register_event(
+                            snow.event_handler.Event.PATH_COMPLETE,
+                            new_path,
+                            snow.event_handler.Action.CALLBACK,
+                            snow.event_handler.Callback(self._background_snow_landed),
+                        )
                         snow.motion.activate_path(new_path)
 
         # Spawn background snowflakes with fadeout
@@ -346,18 +504,18 @@ class MoreSnowIterator(BaseEffectIterator[MoreSnowConfig]):
                     self.spawn_stopped = True
                 else:
                     if self.background_spawn_delay <= 0:
-                        # During fadeout: spawn many fast snowflakes
-                        for _ in range(random.randint(5, 10)):
-                            # Speed increase - 5x faster
-                            self.spawn_background_snowflake(speed_multiplier=5.0)
+                        # During fadeout: spawn many fast snowflakes - 5x faster
+                        self.spawn_background_snowflakes(random.randint(5, 10), speed_multiplier=5.0)
                         self.background_spawn_delay = 1
                     else:
                         self.background_spawn_delay -= 1
             else:
                 # Normal spawning before fadeout
                 if self.background_spawn_delay <= 0:
-                    for _ in range(random.randint(3, 6)):
-                        self.spawn_background_snowflake()
+                    self.spawn_background_snowflakes(
+                        self._spawn_counts[self._spawn_count_index & (_SPAWN_COUNT_RING_SIZE - 1)]
+                    )
+                    self._spawn_count_index += 1
                     self.background_spawn_delay = 2
                 else:
                     self.background_spawn_delay -= 1
@@ -365,8 +523,8 @@ class MoreSnowIterator(BaseEffectIterator[MoreSnowConfig]):
         # Check background snow landing
         self.check_background_snow_landing()
 
-        # End when spawning stopped and all background snow is gone
-        if self.spawn_stopped and len(self.background_snow) == 0:
+        # End when spawning stopped and all background snow has landed and been cleared from the pile
+        if self.spawn_stopped and not self.background_snow and not self._stacked_snow:
             raise StopIteration
 
         # Keep animation running
@@ -8,10 +8,12 @@ Classes:
 
 from __future__ import annotations
 
+import math
 import random
 from dataclasses import dataclass
+from itertools import islice
 
-from terminaltexteffects import Color, Coord, EffectCharacter, Gradient, easing
+from terminaltexteffects import Color, Coord, EffectCharacter, Gradient
 from terminaltexteffects.engine.base_config import BaseConfig
 from terminaltexteffects.engine.base_effect import BaseEffect, BaseEffectIterator
 from terminaltexteffects.utils import argutils
@@ -19,6 +21,55 @@ from terminaltexteffects.utils.argutils import ArgSpec, ParserSpec
 from terminaltexteffects.utils.graphics import ColorPair
 
 
+# In/out sine easing sampled at 257 evenly spaced points, shared by every snowflake path
+_EASE_LUT: tuple[float, ...] = tuple((1 - math.cos(math.pi * i / 256)) / 2 for i in range(257))
+
+
+def _ease_lut(progress_ratio: float) -> float:
+    """Ease in/out like `easing.in_out_sine`, reading the precomputed table instead of calling cos().
+
+    Args:
+        progress_ratio (float): the ratio of the current step to the maximum steps
+
+    Returns:
+        float: 0 <= n <= 1 eased value
+
+    """
+    return _EASE_LUT[int(progress_ratio * 256 + 0.5)]
+
+
+def _sway_waypoints(
+    column: int, top: int, bottom: int, left: int, right: int, sway_amounts: list[int]
+) -> list[Coord]:
+    """Compute the sway waypoints of a snowflake falling from the top of the canvas.
+
+    The flake drifts alternately left and right by each sway amount, at rows evenly spaced
+    between `top` and `bottom`.
+
+    Args:
+        column (int): Starting column of the flake.
+        top (int): Row the flake starts falling from.
+        bottom (int): Row the flake falls to.
+        left (int): Leftmost column a waypoint may use.
+        right (int): Rightmost column a waypoint may use.
+        sway_amounts (list[int]): Columns to drift for each sway.
+
+    Returns:
+        list[Coord]: One waypoint per sway, not including the final waypoint.
+
+    """
+    num_sways = len(sway_amounts) + 1
+    fall_distance = top - bottom
+    waypoints: list[Coord] = []
+    for i, sway_amount in enumerate(sway_amounts, start=1):
+        progress = i / num_sways
+        sway_row = top - int(fall_distance * progress)
+        sway_direction = 1 if i % 2 == 0 else -1
+        column = column + (sway_direction * sway_amount)
+        waypoints.append(Coord(max(left, min(right, column)), sway_row))
+    return waypoints
+
+
 def get_effect_resources() -> tuple[str, type[BaseEffect], type[BaseConfig]]:
     """Get the command, effect class, and configuration class for the effect.
 
@@ -128,70 +179,75 @@ class SnowIterator(BaseEffectIterator[SnowConfig]):
         """
         super().__init__(effect)
         self.pending_chars: list[EffectCharacter] = []
+        # One shared ColorPair per snow color
+        self._color_pairs: dict[Color, ColorPair] = {color: ColorPair(fg=color) for color in self.config.snow_colors}
         self.build()
 
     def build(self) -> None:
         """Build the initial state of the effect."""
         # Setup text characters - falling snow effect
-        for character in self.terminal.get_characters():
+        top, left, right = self.terminal.canvas.top, self.terminal.canvas.left, self.terminal.canvas.right
+        movement_speed = self.config.movement_speed
+        snow_symbols, snow_colors = self.config.snow_symbols, self.config.snow_colors
+        color_pairs = self._color_pairs
+
+        # Draw the speed, sway count and sway amounts for every character up front
+        characters = self.terminal.get_characters()
+        speeds = [movement_speed * (0.7 + 0.6 * random.random()) for _ in characters]  # 0.7x to 1.3x
+        sway_counts = random.choices((2, 3, 4), k=len(characters))
+        sway_amounts = iter(random.choices((1, 2, 3), k=sum(sway_counts) - len(characters)))
+
+        for character, snowflake_speed, num_sways in zip(characters, speeds, sway_counts):
+            input_coord = character.input_coord
+
             # Snow appearance while falling
-            snow_symbol = random.choice(self.config.snow_symbols)
-            snow_color = random.choice(self.config.snow_colors)
-            snow_scene = character.animation.new_scene()
-            snow_scene.add_frame(snow_symbol, 1, colors=ColorPair(fg=snow_color))
+            snow_symbol = random.choice(snow_symbols)
+            snow_color = random.choice(snow_colors)
+            snow_color_pair = color_pairs[snow_color]
+            character.animation.set_appearance(snow_symbol, snow_color_pair)
 
             # Block appearance after landing - use input symbol to reveal text
             block_scene = character.animation.new_scene()
-            block_scene.add_frame(character.input_symbol, 1, colors=ColorPair(fg=snow_color))
-
-            character.animation.activate_scene(snow_scene)
+            block_scene.add_frame(character.input_symbol, 1, colors=snow_color_pair)
 
             # Start above the canvas and fall to input position
-            character.motion.set_coordinate(Coord(character.input_coord.column, self.terminal.canvas.top))
+            character.motion.set_coordinate(Coord(input_coord.column, top))
 
             # Create falling path with swaying
-            snowflake_speed = self.config.movement_speed * random.uniform(0.7, 1.3)
-            fall_path = character.motion.new_path(speed=snowflake_speed, ease=easing.in_out_sine)
+            fall_path = character.motion.new_path(speed=snowflake_speed, ease=_ease_lut)
 
             # Add some sway waypoints
-            num_sways = random.randint(2, 4)
-            fall_distance = self.terminal.canvas.top - character.input_coord.row
-            current_column = character.input_coord.column
-
-            for i in range(1, num_sways):
-                progress = i / num_sways
-                sway_row = self.terminal.canvas.top - int(fall_distance * progress)
-                sway_direction = 1 if i % 2 == 0 else -1
-                sway_amount = random.randint(1, 3)
-                current_column = current_column + (sway_direction * sway_amount)
-                sway_column = max(self.terminal.canvas.left, min(self.terminal.canvas.right, current_column))
-                fall_path.new_waypoint(Coord(sway_column, sway_row))
+            for waypoint in _sway_waypoints(
+                input_coord.column, top, input_coord.row, left, right, list(islice(sway_amounts, num_sways - 1))
+            ):
+                fall_path.new_waypoint(waypoint)
 
             # Final waypoint at input position
-            fall_path.new_waypoint(character.input_coord)
+            fall_path.new_waypoint(input_coord)
 
             # Use event handler to automatically switch to block when path completes
-            character.event_handler.register_event(
-                character.event_handler.Event.PATH_COMPLETE,
+            event_handler = character.event_handler
+            event_handler.register_event(
+                event_handler.Event.PATH_COMPLETE,
                 fall_path,
-                character.event_handler.Action.ACTIVATE_SCENE,
+                event_handler.Action.ACTIVATE_SCENE,
                 block_scene
             )
 
             # Also ensure position is set correctly when path completes
-            character.event_handler.register_event(
-                character.event_handler.Event.PATH_COMPLETE,
+            event_handler.register_event(
+                event_handler.Event.PATH_COMPLETE,
                 fall_path,
-                character.event_handler.Action.SET_COORDINATE,
-                character.input_coord
+                event_handler.Action.SET_COORDINATE,
+                input_coord
             )
 
             character.motion.activate_path(fall_path)
 
             self.pending_chars.append(character)
 
-        # Sort by row (bottom to top) so bottom letters fill first
-        self.pending_chars.sort(key=lambda c: c.input_coord.row, reverse=True)
+        # Release order is random, so shuffle once and pop from the end
+        random.shuffle(self.pending_chars)
 
     def __next__(self) -> str:
         """Return the next frame in the animation."""
@@ -200,7 +256,7 @@ class SnowIterator(BaseEffectIterator[SnowConfig]):
                 # Release a few characters at a time
                 for _ in range(random.randint(1, 3)):
                     if self.pending_chars:
-                        next_character = self.pending_chars.pop(random.randint(0, len(self.pending_chars) - 1))
+                        next_character = self.pending_chars.pop()
                         self.terminal.set_character_visibility(next_character, is_visible=True)
                         self.active_characters.add(next_character)
                     else: